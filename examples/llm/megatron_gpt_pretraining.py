@@ -0,0 +1,142 @@
+# Copyright (c) 2024, NVIDIA CORPORATION.  All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Pretrains a small GPT model with the NeMo 2.0 API, saving distributed checkpoints asynchronously.
+"""
+
+import argparse
+import os
+
+# Let the caching allocator grow segments in place instead of fragmenting on cudaMalloc/cudaFree.
+# Set before importing torch and nemo (which imports transformer_engine) so it is in place before any
+# CUDA allocation; an explicit user setting takes precedence.
+os.environ.setdefault('PYTORCH_CUDA_ALLOC_CONF', 'expandable_segments:True')
+
+from megatron.core.optimizer import OptimizerConfig
+from pytorch_lightning.loggers import TensorBoardLogger
+
+from nemo import lightning as nl
+from nemo.collections import llm
+from nemo.collections.llm.api import train
+from nemo.collections.nlp.modules.common.tokenizer_utils import get_nmt_tokenizer
+from nemo.lightning import NeMoLogger
+from nemo.lightning.pytorch.callbacks import ModelCheckpoint
+from nemo.lightning.pytorch.optim.megatron import MegatronOptimizerModule
+from nemo.utils.callbacks.dist_ckpt_io import AsyncFinalizerCallback
+
+SEQ_LENGTH = 2048
+
+
+def get_args():
+    parser = argparse.ArgumentParser(description='Train a small GPT model using NeMo 2.0')
+    parser.add_argument('--devices', type=int, help="Number of devices to use for training")
+    parser.add_argument('--max-steps', type=int, help="Number of steps to train for")
+    parser.add_argument('--experiment-dir', type=str, help="directory to write results and checkpoints to")
+    parser.add_argument('--data-path', type=str, help="Path to data file")
+    parser.add_argument('--vocab-path', type=str, help="Path to vocab file")
+    parser.add_argument('--merges-path', type=str, help="Path to merges file")
+
+    return parser.parse_args()
+
+
+if __name__ == '__main__':
+
+    args = get_args()
+
+    tokenizer = get_nmt_tokenizer(
+        "megatron",
+        "GPT2BPETokenizer",
+        vocab_file=args.vocab_path,
+        merges_file=args.merges_path,
+        use_fast=True,
+    )
+    data = llm.PreTrainingDataModule(
+        path=args.data_path,
+        seq_length=SEQ_LENGTH,
+        global_batch_size=32,
+        seed=1234,
+        tokenizer=tokenizer,
+        persistent_workers=True,
+        prefetch_factor=4,
+    )
+    gpt_config = llm.GPTConfig(
+        num_layers=12,
+        hidden_size=768,
+        ffn_hidden_size=3072,
+        num_attention_heads=12,
+        seq_length=SEQ_LENGTH,
+        init_method_std=0.023,
+        hidden_dropout=0.1,
+        attention_dropout=0.1,
+        layernorm_epsilon=1e-5,
+        make_vocab_size_divisible_by=128,
+    )
+    model = llm.GPTModel(gpt_config, tokenizer=data.tokenizer)
+
+    # Checkpoints are staged on the host and written to disk by a background process,
+    # the AsyncFinalizerCallback waits for pending saves at the end of training.
+    # Async saving must be enabled on both the strategy and the checkpoint callback.
+    strategy = nl.MegatronStrategy(ckpt_async_save=True)
+    checkpoint_callback = ModelCheckpoint(
+        every_n_train_steps=5000,
+        save_on_train_epoch_end=False,
+        async_save=True,
+    )
+    callbacks = [checkpoint_callback, AsyncFinalizerCallback()]
+
+    loggers = []
+    # Events are written to disk by the SummaryWriter's background thread; a deeper queue keeps
+    # per-step logging from blocking the training loop when that thread falls behind.
+    tensorboard_logger = TensorBoardLogger(
+        save_dir='dummy',  ## NOTE: this gets overwritten by default
+        max_queue=1000,
+    )
+    loggers.append(tensorboard_logger)
+
+    # With bf16=True the Megatron optimizer keeps bf16 model params and fp32 main params, sharded
+    # across data-parallel ranks by the distributed optimizer.
+    opt_config = OptimizerConfig(
+        optimizer='adam',
+        lr=6e-4,
+        min_lr=6e-5,
+        use_distributed_optimizer=True,
+        bf16=True,
+    )
+    opt = MegatronOptimizerModule(config=opt_config)
+
+    trainer = nl.Trainer(
+        devices=args.devices,
+        max_steps=args.max_steps,
+        accelerator="gpu",
+        strategy=strategy,
+        logger=loggers,
+        callbacks=callbacks,
+        log_every_n_steps=1,
+        # amp_O2 stays off: main params are already handled by the Megatron optimizer above.
+        plugins=nl.MegatronMixedPrecision(precision="bf16-mixed", amp_O2=False),
+    )
+
+    nemo_logger = NeMoLogger(
+        dir=args.experiment_dir,
+    )
+
+    train(
+        model=model,
+        data=data,
+        trainer=trainer,
+        log=nemo_logger,
+        tokenizer='data',
+        optim=opt,
+    )
@@ -1,5 +1,5 @@
 import inspect
-from typing import Callable, Iterable, Protocol, TypeVar, Union, runtime_checkable
+from typing import Callable, FrozenSet, Iterable, Protocol, TypeVar, Union, runtime_checkable
 
 from torch import nn
 
@@ -55,16 +55,21 @@ def map(  # noqa: A001
         print(model)
 
     """
+    func_parameters = kwargs.pop("_func_parameters", None)
     if not kwargs.pop("_skip_map", False) and hasattr(module, "map"):
         return module.map(func, leaf_only=leaf_only, **kwargs)
 
-    elif isinstance(module, Iterable):
+    if func_parameters is None:
+        # `func` is called once per visited module, so its signature is inspected once per traversal
+        func_parameters = _func_parameters(func)
+
+    if isinstance(module, Iterable):
         if all(hasattr(module, key) for key in ["items", "values", "keys"]):
-            return _map_module_dict(module, func, leaf_only=leaf_only, **kwargs)
+            return _map_module_dict(module, func, leaf_only=leaf_only, func_parameters=func_parameters, **kwargs)
 
-        return _map_module_list(module, func, leaf_only=leaf_only, **kwargs)
+        return _map_module_list(module, func, leaf_only=leaf_only, func_parameters=func_parameters, **kwargs)
     else:
-        return _map_module(module, func, leaf_only=leaf_only, **kwargs)
+        return _map_module(module, func, leaf_only=leaf_only, func_parameters=func_parameters, **kwargs)
 
 
 def walk(
@@ -160,7 +165,14 @@ def forall(module: nn.Module, func: ModulePredicate, recurse: bool = False) -> b
 
 
 def _map_module(
-    module: _TModule, func: ModuleFunc, recurse=False, leaf_only=False, transformed_modules=None, **kwargs
+    module: _TModule,
+    func: ModuleFunc,
+    recurse=False,
+    leaf_only=False,
+    transformed_modules=None,
+    *,
+    func_parameters: FrozenSet[str],
+    **kwargs,
 ) -> _TModule:
     """
     Applies a transformation function to a module and optionally to its child modules.
@@ -177,6 +189,8 @@ def _map_module(
         Whether to apply the function only to modules without parameters.
     transformed_modules : set, optional
         A set to keep track of modules that have already been transformed.
+    func_parameters : frozenset
+        The parameter names of `func`, computed once per traversal by `map`.
     **kwargs : dict
         Additional keyword arguments that will be passed to the transformation function.
 
@@ -192,9 +206,9 @@ def _map_module(
         return module
 
     new_module = module
-    f_kwargs = _get_func_kwargs(func, **kwargs)
+    f_kwargs = _get_func_kwargs(func_parameters, **kwargs)
 
-    if not leaf_only or list(module.parameters(recurse=False)):
+    if not leaf_only or next(module.parameters(recurse=False), None) is not None:
         new_module = func(new_module, **f_kwargs)
 
     prefix = kwargs.get("name", "") if not kwargs.get("prefix", "") else f"{kwargs['prefix']}.{kwargs['name']}"
@@ -212,6 +226,7 @@ def _map_module(
                 recurse=recurse,
                 leaf_only=leaf_only,
                 transformed_modules=transformed_modules,
+                _func_parameters=func_parameters,
                 i=i,
                 name=name,
                 prefix=prefix,
@@ -225,12 +240,19 @@ def _map_module(
 
 
 def _map_module_list(
-    module_list: _TModule, func: ModuleFunc, recurse=False, leaf_only=False, transformed_modules=None, **kwargs
+    module_list: _TModule,
+    func: ModuleFunc,
+    recurse=False,
+    leaf_only=False,
+    transformed_modules=None,
+    *,
+    func_parameters: FrozenSet[str],
+    **kwargs,
 ) -> _TModule:
     if transformed_modules is None:
         transformed_modules = set()
 
-    f_kwargs = _get_func_kwargs(func, **kwargs)
+    f_kwargs = _get_func_kwargs(func_parameters, **kwargs)
     if not leaf_only:
         module_list = func(module_list, **f_kwargs)
 
@@ -246,6 +268,7 @@ def _map_module_list(
             recurse=recurse,
             leaf_only=leaf_only,
             transformed_modules=transformed_modules,
+            _func_parameters=func_parameters,
             i=i,
             name=str(i),
             prefix=prefix,
@@ -262,6 +285,8 @@ def _map_module_dict(
     recurse: bool = False,
     leaf_only: bool = False,
     transformed_modules=None,
+    *,
+    func_parameters: FrozenSet[str],
     **kwargs,
 ) -> _TModule:
     """
@@ -288,7 +313,7 @@ def _map_module_dict(
     if transformed_modules is None:
         transformed_modules = set()
 
-    f_kwargs = _get_func_kwargs(func, **kwargs)
+    f_kwargs = _get_func_kwargs(func_parameters, **kwargs)
     if not leaf_only:
         module_dict = func(module_dict, **f_kwargs)
 
@@ -303,6 +328,7 @@ def _map_module_dict(
             recurse=recurse,
             leaf_only=leaf_only,
             transformed_modules=transformed_modules,
+            _func_parameters=func_parameters,
             **kwargs,
         )
 
@@ -318,6 +344,9 @@ def _create_list_wrapper(module_list, to_add):
     return type(module_list)(to_add)  # Don't unpack new_modules
 
 
-def _get_func_kwargs(func, **kwargs):
-    sig = inspect.signature(func)
-    return {kwarg: value for kwarg, value in kwargs.items() if kwarg in sig.parameters}
+def _func_parameters(func) -> FrozenSet[str]:
+    return frozenset(inspect.signature(func).parameters)
+
+
+def _get_func_kwargs(func_parameters: FrozenSet[str], **kwargs):
+    return {kwarg: value for kwarg, value in kwargs.items() if kwarg in func_parameters}
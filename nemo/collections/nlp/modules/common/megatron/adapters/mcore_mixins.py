@@ -44,6 +44,21 @@ from nemo.collections.nlp.modules.common.megatron.adapters.parallel_adapters imp
 from nemo.core import adapter_mixins
 
 
+def _add_lora_output(output: torch.Tensor, lora_output) -> torch.Tensor:
+    """
+    Adds the output of a LoRA adapter to the output of the linear layer it wraps.
+    The add is done in place when possible to avoid materializing another activation-sized tensor.
+    Views (e.g. tensors returned by TE or Megatron autograd functions) can't be modified in place
+    and fall back to an out-of-place add.
+    """
+    if not isinstance(lora_output, torch.Tensor):
+        # no LoRA adapter is enabled
+        return output
+    if output._is_view() or output.shape != lora_output.shape or output.dtype != lora_output.dtype:
+        return output + lora_output
+    return output.add_(lora_output)
+
+
 def swap_mcore_mixin(module, mcore_mixin):
     """
     Casts module to mcore_mixin and register corresponding adapters.
@@ -114,7 +129,7 @@ class MCoreSelfAttentionMixin(SelfAttention, MCoreAdapterModuleMixin):
                 else:
                     lora_mixed_qkv = lora_kqv_adapter(hidden_states)
 
-                mixed_qkv = mixed_qkv + lora_mixed_qkv
+                mixed_qkv = _add_lora_output(mixed_qkv, lora_mixed_qkv)
 
         # [sq, b, hp] --> [sq, b, ng, (np/ng + 2) * hn]
         new_tensor_shape = mixed_qkv.size()[:-1] + (
@@ -267,11 +282,14 @@ class MCoreSelfAttentionMixin(SelfAttention, MCoreAdapterModuleMixin):
 
         output, bias = self.linear_proj(core_attn_out)
         # LoRA logic
+        # The adapter is not overlapped with linear_proj on a side stream: with TP > 1 its row-parallel linear_in
+        # reduces on the same communicator as linear_proj and serializes behind it, so only the small adapter GEMM
+        # could overlap.
         if self.is_adapter_available():
             lora_linear_proj_adapter = self.get_adapter_module(AdapterName.LORA_DENSE_ATTENTION_ADAPTER)
             if lora_linear_proj_adapter and self.adapter_cfg[AdapterName.LORA_DENSE_ATTENTION_ADAPTER]['enabled']:
                 lora_output = lora_linear_proj_adapter(core_attn_out)
-                output = output + lora_output
+                output = _add_lora_output(output, lora_output)
 
         return output, bias
 
@@ -332,7 +350,7 @@ class MCoreMLPMixin(MLP, MCoreAdapterModuleMixin):
                 lora_output = lora_adapter(layernorm_output)
             elif lora_moe_fc1_adapter and self.adapter_cfg[AdapterName.LORA_MOE_Hto4H_ADAPTER]['enabled']:
                 lora_output = lora_moe_fc1_adapter(layernorm_output, expert_idx)
-            intermediate_parallel = intermediate_parallel + lora_output
+            intermediate_parallel = _add_lora_output(intermediate_parallel, lora_output)
 
         if self.config.bias_activation_fusion:
             if self.activation_func == F.gelu:
@@ -381,7 +399,7 @@ class MCoreMLPMixin(MLP, MCoreAdapterModuleMixin):
             elif lora_moe_fc2_adapter and self.adapter_cfg[AdapterName.LORA_MOE_4HtoH_ADAPTER]['enabled']:
                 lora_output = lora_moe_fc2_adapter(intermediate_parallel, expert_idx)
 
-            output = output + lora_output
+            output = _add_lora_output(output, lora_output)
 
         return output, output_bias
 
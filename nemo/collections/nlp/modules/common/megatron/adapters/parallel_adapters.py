@@ -14,6 +14,7 @@
 # limitations under the License.
 
 import enum
+import functools
 import logging
 import math
 import re
@@ -134,6 +135,19 @@ class MLPInfusedAdapterConfig(InfusedAdapterConfig):
     _target_: str = "{0}.{1}".format(MLPInfusedAdapter.__module__, MLPInfusedAdapter.__name__)
 
 
+@functools.lru_cache(maxsize=None)
+def _get_te_version():
+    """
+    Transformer Engine version, looked up once since adapters are created for every layer of the model
+    and reading the installed package metadata is slow.
+    """
+    from importlib.metadata import version
+
+    from pkg_resources import packaging
+
+    return packaging.version.Version(version("transformer-engine"))
+
+
 class ParallelLinearAdapter(nn.Module, AdapterModuleUtil):
     def __init__(
         self,
@@ -249,11 +263,9 @@ class ParallelLinearAdapter(nn.Module, AdapterModuleUtil):
         # revert config change in case it is read elsewhere
         model_parallel_config.sequence_parallel = self._sequence_parallel
         if self._sequence_parallel and not input_is_parallel:
-            from importlib.metadata import version
-
             from pkg_resources import packaging
 
-            te_version = packaging.version.Version(version("transformer-engine"))
+            te_version = _get_te_version()
             if te_version >= packaging.version.Version("1.5.0dev") and (
                 not self.input_is_parallel and model_parallel_config.tp_comm_disable_qkv
             ):
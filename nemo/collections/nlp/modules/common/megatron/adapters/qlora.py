@@ -229,7 +229,7 @@ def qlora_load_model(model: 'MCoreGPTModel', model_cfg: 'DictConfig', checkpoint
         for name, child in module.named_children():
             if name in qlora_targets:
                 bf16_weight = checkpoint[f"{prefix}.{name}.weight"].to(torch.bfloat16)
-                logging.info(f'QLoRA: Quantizing linear layer: {prefix}.{name}')
+                logging.info('QLoRA: Quantizing linear layer: %s.%s', prefix, name)
                 layer_norm_weight = checkpoint.get(f"{prefix}.{name}.layer_norm_weight", None)
                 if layer_norm_weight is None:
                     setattr(module, name, NF4LinearWrapper(bf16_weight))
@@ -88,7 +88,8 @@ def get_tokenizer(
         tokenizer_model: tokenizer model file of sentencepiece
         special_tokens: dict of special tokens
         vocab_file: path to vocab file
-        use_fast: (only for HuggingFace AutoTokenizer) set to True to use fast HuggingFace tokenizer
+        use_fast: (only for HuggingFace AutoTokenizer and the HuggingFace-backed megatron tokenizers, e.g.
+            GPT2BPETokenizer) set to True to use fast HuggingFace tokenizer
         bpe_dropout: (experimental) BPE dropout tries to corrupt the standard segmentation
             procedure of BPE to help
             model better learn word compositionality and become robust to segmentation errors. 
@@ -158,7 +159,8 @@ def get_nmt_tokenizer(
         tokenizer_model: tokenizer model file of sentencepiece
         special_tokens: dict of special tokens
         vocab_file: path to vocab file
-        use_fast: (only for HuggingFace AutoTokenizer) set to True to use fast HuggingFace tokenizer
+        use_fast: (only for HuggingFace AutoTokenizer and the HuggingFace-backed megatron tokenizers, e.g.
+            GPT2BPETokenizer) set to True to use fast HuggingFace tokenizer
         bpe_dropout: (experimental) BPE dropout tries to corrupt the standard segmentation procedure
             of BPE to help model better learn word compositionality and become robust to segmentation errors.
             It has empirically been shown to improve inference time BLEU scores.
@@ -209,7 +211,9 @@ def get_nmt_tokenizer(
         logging.info(
             f'Getting Megatron tokenizer for pretrained model name: {model_name}, custom vocab file: {vocab_file}, and merges file: {merges_file}'
         )
-        return get_tokenizer(tokenizer_name=model_name, vocab_file=vocab_file, merges_file=merges_file)
+        return get_tokenizer(
+            tokenizer_name=model_name, vocab_file=vocab_file, merges_file=merges_file, use_fast=use_fast
+        )
     elif library == 'tabular':
         return TabularTokenizer(vocab_file, delimiter=delimiter)
     else:
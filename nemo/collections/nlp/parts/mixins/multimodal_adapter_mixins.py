@@ -17,7 +17,11 @@ from typing import List, Optional, Union
 import torch
 
 from nemo.collections.nlp.models.nlp_model import NLPModel
-from nemo.collections.nlp.parts.mixins.nlp_adapter_mixins import NLPAdapterModelMixin, replace_prefix
+from nemo.collections.nlp.parts.mixins.nlp_adapter_mixins import (
+    NLPAdapterModelMixin,
+    _mcore_target_names,
+    replace_prefix,
+)
 from nemo.collections.nlp.parts.peft_config import PEFT_CONFIG_MAP, PEFTConfig, PtuningPEFTConfig
 from nemo.core.classes.mixins.adapter_mixins import AdapterModuleMixin
 from nemo.utils import logging, model_utils
@@ -156,11 +160,7 @@ class MultimodalAdapterModelMixin(NLPAdapterModelMixin):
     ):
         if name_key_to_mcore_mixins is not None:
             for mcore_target, mcore_mixin in name_key_to_mcore_mixins[peft_name]:
-                if name in [
-                    mcore_target,
-                    f'model.{mcore_target}',
-                    f'model.module.{mcore_target}',
-                ]:  # simple string match for now
+                if name in _mcore_target_names(mcore_target):  # simple string match for now
                     swap_mcore_mixin(module, mcore_mixin)
                     if model_utils.import_class_by_path(peft_cfg._target_) in module.get_accepted_adapter_types():
                         module.add_adapter(
@@ -12,6 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import functools
 import os
 import tempfile
 from typing import List, Optional, Union
@@ -58,6 +59,12 @@ def replace_prefix(name, old_prefix, new_prefix):
     return name.replace(old_prefix, new_prefix, 1)
 
 
+@functools.lru_cache(maxsize=None)
+def _mcore_target_names(mcore_target):
+    """Module names that ``mcore_target`` can appear under, with or without the model wrappers."""
+    return frozenset((mcore_target, f'model.{mcore_target}', f'model.module.{mcore_target}'))
+
+
 class NLPAdapterModelMixin:
     """NLP Adapter Mixin that can augment any transformer-based model with Adapter module support.
     This mixin class should be used only with a top level ModelPT subclass, that includes either a `model` or an `enc_dec_model` submodule.
@@ -121,11 +128,7 @@ class NLPAdapterModelMixin:
     def _check_and_add_adapter(self, name, module, peft_name, peft_cfg, name_key_to_mcore_mixins=None):
         if name_key_to_mcore_mixins is not None:
             for mcore_target, mcore_mixin in name_key_to_mcore_mixins[peft_name]:
-                if name in [
-                    mcore_target,
-                    f'model.{mcore_target}',
-                    f'model.module.{mcore_target}',
-                ]:  # simple string match for now
+                if name in _mcore_target_names(mcore_target):  # simple string match for now
                     swap_mcore_mixin(module, mcore_mixin)
                     if model_utils.import_class_by_path(peft_cfg._target_) in module.get_accepted_adapter_types():
                         module.add_adapter(
@@ -175,8 +178,9 @@ class NLPAdapterModelMixin:
                     )
 
                 layers = self._get_layers_from_model(self._unwrap_model())
+                selected_layer_numbers = set(layer_selection or range(1, self.cfg.num_layers + 1))
                 for layer in layers:
-                    if layer.layer_number in (layer_selection or list(range(1, self.cfg.num_layers + 1))):
+                    if layer.layer_number in selected_layer_numbers:
                         for name, module in layer.named_modules():
                             self._check_and_add_adapter(
                                 name, module, adapter_name, adapter_cfg, name_key_to_mcore_mixins
@@ -379,7 +383,7 @@ class NLPAdapterModelMixin:
 
         for adapter_name in layer0.adapter_layer:
             adapter = layer0.get_adapter_module(adapter_name)
-            print(adapter_name, pos_idx)
+            logging.debug("Tying adapter %s at position %d", adapter_name, pos_idx)
             adapter.set_position(pos_idx)
             pos_idx += 1
 
@@ -387,7 +391,7 @@ class NLPAdapterModelMixin:
             if isinstance(peft_cfg, LoraPEFTConfig):
                 layer = layer.self_attention
             for adapter_name in layer.adapter_layer:
-                print(adapter_name, pos_idx)
+                logging.debug("Tying adapter %s at position %d", adapter_name, pos_idx)
                 adapter_l = layer.get_adapter_module(adapter_name)
                 adapter_0 = layer0.get_adapter_module(adapter_name)
                 adapter_l.tie_weights(pos_idx, adapter_0)
@@ -454,6 +458,7 @@ class NLPAdapterModelMixin:
                         else:
                             checkpoint_state_dict = checkpoint['state_dict']
                         # checkpoint_state_dict has "model." but module does not so we need to remove it when loading
+                        # pop (not read) the keys: load_state_dict() relies on getting an empty dict after this hook
                         checkpoint_state_dict = {
                             key.replace('model.', ''): checkpoint_state_dict.pop(key)
                             for key in list(checkpoint_state_dict.keys())
@@ -902,17 +902,12 @@ class AdapterModelPTMixin(AdapterModuleMixin):
                         # layers and blocks, all of which require an adapter.
                         adapter_module = module.get_adapter_module(adapter_name)
                         if adapter_module is not None:
-                            # If the module was found, then extract the entire adapter ModuleDict state_dict(),
-                            # Then select only the parts of the state dict that correspond to the current adapter_name.
+                            # If the module was found, then extract only the state dict of the current adapter,
+                            # prefixed by the adapter_name as it would appear in the adapter ModuleDict state_dict().
                             # This is done so that it preserves the relation ship of the module name : parameters
-                            # inside of the state dict.
+                            # inside of the state dict, without traversing the other adapters of the ModuleDict.
                             # It will be normalized in the corresponding `load_adapters()` call.
-                            adapter_state_dict = module.adapter_layer.state_dict()
-                            state_dict = {}
-                            for k, v in adapter_state_dict.items():
-                                if adapter_name in k:
-                                    state_dict[k] = v
-
+                            state_dict = adapter_module.state_dict(prefix=f'{adapter_name}.')
                             output_dict[key].append(state_dict)
 
         # Preserve the binary OmegaConf dictionary of the model's adapter config
@@ -120,6 +120,7 @@ def add_megatron_sampler(
         num_workers=dataloader.num_workers,
         pin_memory=dataloader.pin_memory,
         persistent_workers=dataloader.persistent_workers,
+        prefetch_factor=dataloader.prefetch_factor,
         collate_fn=dataloader.collate_fn,
     )
 
@@ -1,11 +1,10 @@
 import logging
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Callable, Dict, Generic, Optional, TypeVar, Union
+from typing import TYPE_CHECKING, Any, Callable, Dict, Generic, Optional, TypeVar, Union
 
 import pytorch_lightning as pl
 import torch
-from lightning_fabric.plugins.io.checkpoint_io import CheckpointIO
 from lightning_fabric.utilities.cloud_io import get_filesystem
 from lightning_fabric.utilities.types import _PATH
 from torch import nn
@@ -13,6 +12,10 @@ from typing_extensions import Self, override
 
 from nemo.lightning.io.capture import IOProtocol
 from nemo.lightning.io.mixin import IOMixin
+from nemo.utils.async_checkpoint_io import AsyncCompatibleCheckpointIO
+
+if TYPE_CHECKING:
+    from nemo.utils.callbacks.torch_dist_async import AsyncRequest
 
 
 log = logging.getLogger(__name__)
@@ -46,23 +49,36 @@ class TrainerContext(IOMixin, Generic[LightningModuleT]):
         return extra
 
 
-class MegatronCheckpointIO(CheckpointIO):
-    """CheckpointIO that utilizes :func:`torch.save` and :func:`torch.load` to save and load checkpoints respectively,
-    common for most use cases.
+class MegatronCheckpointIO(AsyncCompatibleCheckpointIO):
+    """CheckpointIO that utilizes megatron-core distributed checkpointing to save and load checkpoints.
+
+    With the default ``torch_dist`` format every rank serializes its shards into a single file,
+    so a save results in one large sequential write per rank instead of one file per tensor.
+    When ``async_save`` is enabled the shards are first staged in host memory and the write
+    happens in a background process.
 
     .. warning::  This is an :ref:`experimental <versioning:Experimental API>` feature.
 
+    Args:
+        save_ckpt_format (str): Distributed checkpoint format to use for checkpoint saving.
+        async_save (bool): whether to save asynchronously. Should be set to True if
+            this class will be wrapped with AsyncFinalizableCheckpointIO.
+
     """
 
     def __init__(
         self,
         save_ckpt_format: str = 'torch_dist',
+        async_save: bool = False,
     ):
         self.save_ckpt_format = save_ckpt_format
+        self.async_save = async_save
         self.save_sharded_strategy = self._determine_dist_ckpt_save_strategy()
 
     @override
-    def save_checkpoint(self, checkpoint: Dict[str, Any], path: _PATH, storage_options: Optional[Any] = None) -> None:
+    def save_checkpoint(
+        self, checkpoint: Dict[str, Any], path: _PATH, storage_options: Optional[Any] = None
+    ) -> Optional['AsyncRequest']:
         """Save model/training states as a checkpoint file through state-dump and file-write.
 
         Args:
@@ -70,6 +86,11 @@ class MegatronCheckpointIO(CheckpointIO):
             path: write-target path
             storage_options: not used in ``TorchCheckpointIO.save_checkpoint``
 
+        Returns
+        -------
+            The async request to be scheduled by AsyncFinalizableCheckpointIO if ``async_save``
+            is enabled, otherwise None.
+
         Raises
         ------
             TypeError:
@@ -78,7 +99,8 @@ class MegatronCheckpointIO(CheckpointIO):
         """
         from megatron.core import dist_checkpointing
 
-        if storage_options is not None:
+        # AsyncFinalizableCheckpointIO consumes the `finalize_fn` entry and may pass an empty dict
+        if storage_options:
             raise TypeError(
                 "`Trainer.save_checkpoint(..., storage_options=...)` with `storage_options` arg"
                 f" is not supported for `{self.__class__.__name__}`. Please implement your custom `CheckpointIO`"
@@ -88,7 +110,12 @@ class MegatronCheckpointIO(CheckpointIO):
         fs = get_filesystem(checkpoint_dir)
         if fs.isdir(checkpoint_dir) and dist_checkpointing.check_is_distributed_checkpoint(checkpoint_dir):
             logging.info(f'Distributed checkpoint at path {checkpoint_dir} already exists, skipping saving')
-            return
+            if self.async_save:
+                from nemo.utils.callbacks.torch_dist_async import AsyncRequest
+
+                # noop request so the finalization callbacks are still executed
+                return AsyncRequest(None, (), [])
+            return None
         fs.makedirs(checkpoint_dir, exist_ok=True)
 
         dist_checkpointing.save(
@@ -96,6 +123,12 @@ class MegatronCheckpointIO(CheckpointIO):
             checkpoint_dir=str(checkpoint_dir),
             sharded_strategy=self.save_sharded_strategy,
         )
+        if not self.async_save:
+            return None
+
+        async_request = self.save_sharded_strategy.async_request
+        self.save_sharded_strategy.async_request = None
+        return async_request
 
     @override
     def load_checkpoint(
@@ -151,6 +184,12 @@ class MegatronCheckpointIO(CheckpointIO):
         otherwise relies on MCore to create a proper strategy based on ckpt format.
         """
         save_strategy = (self.save_ckpt_format, 1)
+        if self.async_save:
+            from nemo.utils.callbacks.torch_dist_async import TorchDistAsyncSaveShardedStrategy
+
+            if save_strategy[0] != 'torch_dist':
+                raise ValueError('Async dist-ckpt save supported only for torch_dist format')
+            save_strategy = TorchDistAsyncSaveShardedStrategy('torch_dist', 1)
 
         logging.info(f'Using {save_strategy} dist-ckpt save strategy.')
         return save_strategy
@@ -73,6 +73,10 @@ class MegatronStrategy(DDPStrategy, io.IOMixin):
         enable_nemo_ckpt_io (bool): Enable NeMo checkpoint I/O. Defaults to True.
         ckpt_type (TrainerCkptProtocol): Checkpoint type. Defaults to TrainerCheckpoint.
         ckpt_include_optimizer (bool): Include optimizer state in checkpoint. Defaults to False.
+        ckpt_async_save (bool): Save distributed checkpoints asynchronously. The checkpoint is staged
+            on the host and written to storage by a background process, so training only blocks for
+            the staging. Requires the ModelCheckpoint callback to be created with ``async_save=True``
+            and an AsyncFinalizerCallback. Defaults to False.
         ddp (Union[DDPLiteral, DistributedDataParallelConfig]): DDP configuration. Defaults to "megatron".
         lazy_init (bool): Use lazy initialization for model parallel parameters. Defaults to False.
         pipeline_dtype (Optional[torch.dtype]): Data type for pipeline parallelism. Defaults to None.
@@ -100,6 +104,7 @@ class MegatronStrategy(DDPStrategy, io.IOMixin):
         checkpoint_io=None,  # TODO: Add type-hint
         find_unused_parameters: bool = False,
         ckpt_include_optimizer: bool = False,
+        ckpt_async_save: bool = False,
         ddp: Union[DDPLiteral, DistributedDataParallelConfig] = "megatron",
         lazy_init: bool = False,
         pipeline_dtype: Optional[torch.dtype] = None,
@@ -124,6 +129,7 @@ class MegatronStrategy(DDPStrategy, io.IOMixin):
         self.sequence_parallel = sequence_parallel
         self.lazy_init = lazy_init
         self.ckpt_include_optimizer = ckpt_include_optimizer
+        self.ckpt_async_save = ckpt_async_save
         self.pipeline_dtype = pipeline_dtype
         self.log_train_loss = bool(int(os.getenv("NEMO_LOG_TRAIN_LOSS", 1)))
         self.log_memory_usage = bool(int(os.getenv("NEMO_LOG_MEMORY_USAGE", 0)))
@@ -558,9 +564,14 @@ class MegatronStrategy(DDPStrategy, io.IOMixin):
     @override
     def checkpoint_io(self) -> CheckpointIO:
         if self._checkpoint_io is None:
-            self._checkpoint_io = MegatronCheckpointIO()
-        elif isinstance(self._checkpoint_io, _WrappingCheckpointIO):
-            self._checkpoint_io.checkpoint_io = MegatronCheckpointIO()
+            checkpoint_io = MegatronCheckpointIO(async_save=self.ckpt_async_save)
+            if self.ckpt_async_save:
+                from nemo.utils.callbacks.dist_ckpt_io import AsyncFinalizableCheckpointIO
+
+                checkpoint_io = AsyncFinalizableCheckpointIO(checkpoint_io)
+            self._checkpoint_io = checkpoint_io
+        elif isinstance(self._checkpoint_io, _WrappingCheckpointIO) and self._checkpoint_io.checkpoint_io is None:
+            self._checkpoint_io.checkpoint_io = MegatronCheckpointIO(async_save=self.ckpt_async_save)
 
         return self._checkpoint_io
 
@@ -14,19 +14,18 @@
 
 import os
 import shutil
-from abc import ABC, abstractmethod
 from contextlib import contextmanager
 from time import time
 from typing import Any, Dict, Optional
 
 import pytorch_lightning as pl
-from lightning_fabric.plugins import CheckpointIO
 from lightning_fabric.utilities.cloud_io import get_filesystem
 from lightning_fabric.utilities.types import _PATH
 from pytorch_lightning import Callback
 from pytorch_lightning.plugins.io.wrapper import _WrappingCheckpointIO
 
 from nemo.utils import logging
+from nemo.utils.async_checkpoint_io import AsyncCompatibleCheckpointIO
 
 try:
     from megatron.core import dist_checkpointing
@@ -54,21 +53,6 @@ def _debug_time(name: str):
         logging.debug(f'{name} took {time() - start:.3f}s')
 
 
-class AsyncCompatibleCheckpointIO(CheckpointIO, ABC):
-    """CheckpointIO that can be used together with async saving.
-
-    Differs from the regular CheckpointIO only by the `save_checkpoint`
-    return type. The `save_checkpoint` method itself is synchronous, but returns
-    callbacks that can be performed asynchronously.
-    """
-
-    @abstractmethod
-    def save_checkpoint(
-        self, checkpoint: Dict[str, Any], path: _PATH, storage_options: Optional[Any] = None
-    ) -> 'AsyncRequest':
-        raise NotImplementedError
-
-
 class AsyncFinalizableCheckpointIO(_WrappingCheckpointIO):
     """CheckpointIO wrapper for async checkpoint saving and synchronous finalization.
 
@@ -1,3 +1,5 @@
+from unittest.mock import MagicMock
+
 import pytest
 import torch
 import torch.nn as nn
@@ -99,6 +101,20 @@ class TestWalkModule:
 
         fn.walk(CustomMLP(), is_linear, leaf_only=True)
 
+    def test_walk_inspects_func_once(self, monkeypatch):
+        from nemo.collections.llm.fn import base
+
+        func_parameters = MagicMock(wraps=base._func_parameters)
+        monkeypatch.setattr(base, "_func_parameters", func_parameters)
+
+        model = nn.Sequential(CustomMLP(), nn.ModuleDict({"mlp": CustomMLP()}), nn.ModuleList([CustomMLP()]))
+        walked = fn.walk(model, add_relu_named)
+
+        func_parameters.assert_called_once_with(add_relu_named)
+        assert isinstance(walked[0].linear1, nn.Sequential)
+        assert isinstance(walked[1]["mlp"].linear1, nn.Sequential)
+        assert isinstance(walked[2][0].linear2, nn.Linear)
+
 
 class TestWalkListModule:
     @pytest.mark.parametrize("module_container", [nn.ModuleList, nn.Sequential])
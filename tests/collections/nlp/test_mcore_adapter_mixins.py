@@ -0,0 +1,87 @@
+# Copyright (c) 2024, NVIDIA CORPORATION.  All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import pytest
+import torch
+
+try:
+
+    from nemo.collections.nlp.modules.common.megatron.adapters.mcore_mixins import _add_lora_output
+
+    HAVE_MEGATRON_CORE = True
+
+except (ImportError, ModuleNotFoundError):
+
+    HAVE_MEGATRON_CORE = False
+
+
+def _linear_outputs(in_place: bool):
+    torch.manual_seed(0)
+    x = torch.randn(4, 8)
+    weight = torch.randn(8, 8, requires_grad=True)
+    lora_weight = torch.randn(8, 8, requires_grad=True)
+
+    output = x @ weight
+    lora_output = x @ lora_weight
+    result = _add_lora_output(output, lora_output) if in_place else output + lora_output
+    result.sum().backward()
+    return result, weight.grad, lora_weight.grad
+
+
+@pytest.mark.skipif(not HAVE_MEGATRON_CORE, reason="megatron-core is not installed")
+class TestAddLoraOutput:
+    @pytest.mark.unit
+    def test_no_adapter_passthrough(self):
+        output = torch.randn(4, 8)
+
+        assert _add_lora_output(output, 0) is output
+
+    @pytest.mark.unit
+    def test_in_place(self):
+        output = torch.randn(4, 8)
+        lora_output = torch.randn(4, 8)
+        expected = output + lora_output
+
+        result = _add_lora_output(output, lora_output)
+
+        assert result is output
+        assert torch.equal(result, expected)
+
+    @pytest.mark.unit
+    def test_in_place_gradients_match_out_of_place(self):
+        result, weight_grad, lora_weight_grad = _linear_outputs(in_place=True)
+        expected, expected_weight_grad, expected_lora_weight_grad = _linear_outputs(in_place=False)
+
+        assert torch.allclose(result, expected)
+        assert torch.allclose(weight_grad, expected_weight_grad)
+        assert torch.allclose(lora_weight_grad, expected_lora_weight_grad)
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize(
+        "output,lora_output",
+        [
+            (torch.randn(8, 4).t(), torch.randn(4, 8)),  # view
+            (torch.randn(4, 1), torch.randn(4, 8)),  # shape mismatch, broadcast
+            (torch.randn(4, 8, dtype=torch.bfloat16), torch.randn(4, 8)),  # dtype mismatch
+        ],
+    )
+    def test_out_of_place_fallback(self, output, lora_output):
+        original = output.clone()
+        expected = output + lora_output
+
+        result = _add_lora_output(output, lora_output)
+
+        assert result is not output
+        assert torch.equal(output, original)
+        assert torch.equal(result, expected)
@@ -0,0 +1,45 @@
+from unittest.mock import MagicMock
+
+from megatron.core import dist_checkpointing
+
+from nemo.lightning.io.pl import MegatronCheckpointIO, ckpt_to_dir
+from nemo.utils.callbacks.torch_dist_async import AsyncRequest
+
+
+class TestMegatronCheckpointIOAsyncSave:
+    def test_save_returns_async_request(self, tmp_path, monkeypatch):
+        save = MagicMock()
+        monkeypatch.setattr(dist_checkpointing, "save", save)
+        checkpoint_io = MegatronCheckpointIO(async_save=True)
+        async_request = AsyncRequest(MagicMock(), (), [])
+        checkpoint_io.save_sharded_strategy = MagicMock(async_request=async_request)
+
+        assert checkpoint_io.save_checkpoint({}, tmp_path / "step=1.ckpt") is async_request
+        save.assert_called_once()
+        # the request is handed over once, a later save must not schedule it again
+        assert checkpoint_io.save_sharded_strategy.async_request is None
+
+    def test_save_sync_returns_none(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(dist_checkpointing, "save", MagicMock())
+        checkpoint_io = MegatronCheckpointIO()
+
+        assert checkpoint_io.save_checkpoint({}, tmp_path / "step=1.ckpt") is None
+
+    def test_existing_checkpoint_returns_noop_request(self, tmp_path, monkeypatch):
+        save = MagicMock()
+        monkeypatch.setattr(dist_checkpointing, "save", save)
+        monkeypatch.setattr(dist_checkpointing, "check_is_distributed_checkpoint", lambda _: True)
+        path = tmp_path / "step=1.ckpt"
+        ckpt_to_dir(path).mkdir()
+        checkpoint_io = MegatronCheckpointIO(async_save=True)
+
+        async_request = checkpoint_io.save_checkpoint({}, path)
+
+        save.assert_not_called()
+        assert async_request.async_fn is None
+        assert async_request.async_fn_args == ()
+        assert async_request.finalize_fns == []
+        # finalization functions can still be attached, e.g. by AsyncFinalizableCheckpointIO
+        finalize_fn = MagicMock()
+        async_request.add_finalize_fn(finalize_fn)
+        assert async_request.finalize_fns == [finalize_fn]
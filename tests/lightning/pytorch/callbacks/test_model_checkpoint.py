@@ -0,0 +1,75 @@
+from unittest.mock import MagicMock, call
+
+import pytest
+
+from nemo.lightning.io.pl import MegatronCheckpointIO
+from nemo.lightning.pytorch.callbacks import ModelCheckpoint
+from nemo.utils.callbacks.dist_ckpt_io import AsyncFinalizableCheckpointIO, AsyncFinalizerCallback
+
+
+def _mock_trainer(ckpt_async_save=True, checkpoint_io=None, callbacks=None):
+    trainer = MagicMock()
+    trainer.strategy.ckpt_async_save = ckpt_async_save
+    trainer.strategy.checkpoint_io = (
+        checkpoint_io if checkpoint_io is not None else MagicMock(spec=AsyncFinalizableCheckpointIO)
+    )
+    trainer.callbacks = callbacks if callbacks is not None else [AsyncFinalizerCallback()]
+    trainer.is_global_zero = False
+    return trainer
+
+
+class TestModelCheckpointAsyncSetup:
+    @pytest.mark.parametrize("async_save,ckpt_async_save", [(True, False), (False, True)])
+    def test_async_flag_mismatch(self, tmp_path, async_save, ckpt_async_save):
+        checkpoint_callback = ModelCheckpoint(dirpath=tmp_path, async_save=async_save)
+
+        with pytest.raises(ValueError, match="does not match"):
+            checkpoint_callback.setup(_mock_trainer(ckpt_async_save=ckpt_async_save), MagicMock(), "fit")
+
+    def test_missing_finalizer_callback(self, tmp_path):
+        checkpoint_callback = ModelCheckpoint(dirpath=tmp_path, async_save=True)
+
+        with pytest.raises(ValueError, match="AsyncFinalizerCallback"):
+            checkpoint_callback.setup(_mock_trainer(callbacks=[]), MagicMock(), "fit")
+
+    def test_non_async_checkpoint_io(self, tmp_path):
+        checkpoint_callback = ModelCheckpoint(dirpath=tmp_path, async_save=True)
+        trainer = _mock_trainer(checkpoint_io=MegatronCheckpointIO())
+
+        with pytest.raises(ValueError, match="AsyncFinalizableCheckpointIO"):
+            checkpoint_callback.setup(trainer, MagicMock(), "fit")
+
+
+class TestModelCheckpointDeferredRemoval:
+    def test_remove_checkpoint_is_deferred(self, tmp_path):
+        checkpoint_callback = ModelCheckpoint(dirpath=tmp_path, async_save=True)
+        checkpoint_callback.deferred_ckpts_to_remove = [["step=1.ckpt"], []]
+        stale_ckpt = tmp_path / "step=2.ckpt"
+        stale_ckpt.touch()
+
+        checkpoint_callback._remove_checkpoint(_mock_trainer(), str(stale_ckpt))
+
+        assert checkpoint_callback.deferred_ckpts_to_remove == [["step=1.ckpt"], [str(stale_ckpt)]]
+        assert stale_ckpt.exists()
+
+    def test_finalize_drains_one_entry(self, tmp_path):
+        checkpoint_callback = ModelCheckpoint(dirpath=tmp_path, async_save=True, enable_nemo_ckpt_io=False)
+        checkpoint_callback.deferred_ckpts_to_remove = [["step=1.ckpt", "step=2.ckpt"], ["step=3.ckpt"]]
+        checkpoint_callback._remove_checkpoint = MagicMock()
+        trainer = _mock_trainer()
+
+        filepath = tmp_path / "step=4.ckpt"
+        ModelCheckpoint.set_checkpoint_unfinished_marker(filepath)
+        finalize_fn = checkpoint_callback._get_finalize_save_checkpoint_callback(trainer, str(filepath), 4)
+        finalize_fn()
+
+        assert checkpoint_callback.deferred_ckpts_to_remove == [["step=3.ckpt"]]
+        checkpoint_callback._remove_checkpoint.assert_has_calls(
+            [
+                call(trainer, "step=1.ckpt", override_async=True),
+                call(trainer, "step=2.ckpt", override_async=True),
+            ]
+        )
+        assert checkpoint_callback._remove_checkpoint.call_count == 2
+        assert not ModelCheckpoint.format_checkpoint_unfinished_marker_path(filepath).exists()
+        assert checkpoint_callback._last_global_step_saved == 4
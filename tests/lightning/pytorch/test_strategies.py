@@ -0,0 +1,23 @@
+from nemo import lightning as nl
+from nemo.lightning.io.pl import MegatronCheckpointIO
+from nemo.utils.callbacks.dist_ckpt_io import AsyncFinalizableCheckpointIO
+
+
+class TestMegatronStrategyCheckpointIO:
+    def test_default_checkpoint_io(self):
+        strategy = nl.MegatronStrategy()
+
+        assert isinstance(strategy.checkpoint_io, MegatronCheckpointIO)
+        assert not strategy.checkpoint_io.async_save
+
+    def test_async_checkpoint_io(self):
+        strategy = nl.MegatronStrategy(ckpt_async_save=True)
+
+        checkpoint_io = strategy.checkpoint_io
+        assert isinstance(checkpoint_io, AsyncFinalizableCheckpointIO)
+        assert isinstance(checkpoint_io.checkpoint_io, MegatronCheckpointIO)
+        assert checkpoint_io.checkpoint_io.async_save
+
+        # the wrapped IO must survive later accesses, e.g. from ModelCheckpoint and save_checkpoint
+        assert strategy.checkpoint_io is checkpoint_io
+        assert checkpoint_io.checkpoint_io.async_save